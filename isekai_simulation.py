@@ -8,15 +8,36 @@ pode ser executado diretamente com Python.
 from __future__ import annotations
 
 import random
+import sys
 from dataclasses import dataclass, field
-from textwrap import fill
+from functools import cached_property, lru_cache
+from textwrap import TextWrapper
 from typing import Dict, List, Tuple
 
 
+_WRAPPER = TextWrapper(width=88)
+
+_ATRIBUTOS = ("vigor", "mana", "sorte", "carisma")
+_ROTULOS_ATRIBUTOS = ("Vigor", "Mana", "Sorte", "Carisma")
+
+# Destinos do epílogo, do pior ao melhor saldo entre glórias e cicatrizes.
+_DESTINOS = (
+    "As cicatrizes acumuladas cobram seu preço. Ainda assim,"
+    " você segue firme, provando que coragem também é resistir.",
+    "Você encontra um equilíbrio delicado entre desafios e glórias,"
+    " levando uma vida tranquila mas cheia de histórias para contar.",
+    "Sua jornada foi marcada por vitórias e amizades sinceras;"
+    " seu nome permanece em memória nas guildas locais.",
+    "Você se torna uma lenda viva, venerado em canções e invocado"
+    " como patrono de heróis por gerações.",
+)
+
+
+@lru_cache(maxsize=256)
 def wrap(text: str) -> str:
     """Quebra o texto em múltiplas linhas para facilitar a leitura."""
 
-    return fill(text, width=88)
+    return _WRAPPER.fill(text)
 
 
 @dataclass
@@ -26,13 +47,33 @@ class Escolha:
     nome: str
     descricao: str
     atributos: Dict[str, int]
+    _deltas: Tuple[int, int, int, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # As escolhas são constantes do módulo; achatamos os modificadores
+        # uma única vez, na ordem de _ATRIBUTOS, para somá-los diretamente.
+        desconhecidos = self.atributos.keys() - set(_ATRIBUTOS)
+        if desconhecidos:
+            raise ValueError(
+                f"Atributos desconhecidos em {self.nome!r}: {', '.join(sorted(desconhecidos))}"
+            )
+        atributos = self.atributos
+        self._deltas = (
+            atributos.get("vigor", 0),
+            atributos.get("mana", 0),
+            atributos.get("sorte", 0),
+            atributos.get("carisma", 0),
+        )
 
+    @cached_property
     def apresentar(self) -> str:
+        """Texto da opção, renderizado uma única vez por escolha."""
+
         atributos_texto = ", ".join(f"{chave}: {valor:+d}" for chave, valor in self.atributos.items())
         return f"{self.nome} — {self.descricao} ({atributos_texto})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Personagem:
     """Estado atual do personagem do jogador."""
 
@@ -41,12 +82,10 @@ class Personagem:
     origem: Escolha
     poder: Escolha
     legado: Escolha
-    atributos: Dict[str, int] = field(default_factory=lambda: {
-        "vigor": 0,
-        "mana": 0,
-        "sorte": 0,
-        "carisma": 0,
-    })
+    vigor: int = 0
+    mana: int = 0
+    sorte: int = 0
+    carisma: int = 0
     gloria: int = 0
     cicatrizes: int = 0
 
@@ -54,13 +93,16 @@ class Personagem:
         """Aplica os modificadores das escolhas aos atributos."""
 
         for escolha in (self.mundo, self.origem, self.poder, self.legado):
-            for chave, valor in escolha.atributos.items():
-                self.atributos[chave] = self.atributos.get(chave, 0) + valor
+            vigor, mana, sorte, carisma = escolha._deltas
+            self.vigor += vigor
+            self.mana += mana
+            self.sorte += sorte
+            self.carisma += carisma
 
-    def resolver_evento(self, evento: "Evento") -> str:
+    def resolver_evento(self, evento: "Evento", rng: random.Random) -> str:
         """Resolve um evento e retorna a narração associada."""
 
-        resultado, descricao = evento.resolver(self)
+        resultado, descricao = evento.resolver(self, rng)
         if resultado == "gloria":
             self.gloria += 1
         elif resultado == "cicatriz":
@@ -71,30 +113,14 @@ class Personagem:
         """Cria um epílogo baseado no desempenho do personagem."""
 
         diferenca = self.gloria - self.cicatrizes
-        if diferenca >= 3:
-            destino = (
-                "Você se torna uma lenda viva, venerado em canções e invocado"
-                " como patrono de heróis por gerações."
-            )
-        elif diferenca >= 1:
-            destino = (
-                "Sua jornada foi marcada por vitórias e amizades sinceras;"
-                " seu nome permanece em memória nas guildas locais."
-            )
-        elif diferenca == 0:
-            destino = (
-                "Você encontra um equilíbrio delicado entre desafios e glórias,"
-                " levando uma vida tranquila mas cheia de histórias para contar."
-            )
-        else:
-            destino = (
-                "As cicatrizes acumuladas cobram seu preço. Ainda assim,"
-                " você segue firme, provando que coragem também é resistir."
-            )
+        indice = 0 if diferenca < 0 else 1 if diferenca == 0 else 2 if diferenca < 3 else 3
+        destino = _DESTINOS[indice]
 
         resumo_atributos = ", ".join(
-            f"{chave.capitalize()}: {valor}"
-            for chave, valor in self.atributos.items()
+            f"{rotulo}: {valor}"
+            for rotulo, valor in zip(
+                _ROTULOS_ATRIBUTOS, (self.vigor, self.mana, self.sorte, self.carisma)
+            )
         )
         return wrap(
             f"No fim da aventura, {self.nome} registra {self.gloria} feitos gloriosos"
@@ -111,42 +137,45 @@ class Evento:
         self.descricao = descricao
         self.escolhas = escolhas
 
+    @cached_property
     def apresentar(self) -> str:
+        """Cabeçalho e opções do evento, renderizados uma única vez."""
+
         cabecalho = f"\n=== {self.titulo} ===\n{wrap(self.descricao)}\n"
         opcoes = []
         for indice, (identificador, texto, _resultado) in enumerate(self.escolhas, start=1):
             opcoes.append(f"  {indice}. {texto} [{identificador}]")
         return cabecalho + "\n".join(opcoes)
 
-    def resolver(self, personagem: Personagem) -> Tuple[str, str]:
+    def resolver(self, personagem: Personagem, rng: random.Random) -> Tuple[str, str]:
         indice = solicitar_indice(len(self.escolhas))
         identificador, texto, resultado = self.escolhas[indice]
-        narrativa = self._narrativa(resultado, personagem)
+        narrativa = self._narrativa(resultado, personagem, rng)
         return resultado, wrap(f"Você opta por {texto.lower()}. {narrativa}")
 
-    def _narrativa(self, resultado: str, personagem: Personagem) -> str:
+    def _narrativa(self, resultado: str, personagem: Personagem, rng: random.Random) -> str:
         """Gera um texto dinâmico baseado no resultado."""
 
-        sorte = personagem.atributos.get("sorte", 0)
-        mana = personagem.atributos.get("mana", 0)
-        carisma = personagem.atributos.get("carisma", 0)
-        vigor = personagem.atributos.get("vigor", 0)
+        sorte = personagem.sorte
+        mana = personagem.mana
+        carisma = personagem.carisma
+        vigor = personagem.vigor
 
         if resultado == "gloria":
-            bonus = random.randint(0, 2) + max(sorte, carisma) // 2
+            bonus = rng.randrange(3) + max(sorte, carisma) // 2
             return (
                 "O mundo sorri para você. Seus aliados celebram, e o deus Gem"
                 f" concede uma bênção adicional de {bonus} pontos de inspiração."
             )
         if resultado == "cicatriz":
-            penalidade = random.randint(0, 2) - min(vigor, sorte) // 3
+            penalidade = rng.randrange(3) - min(vigor, sorte) // 3
             return (
                 "O desafio cobra seu preço; uma nova cicatriz surge, mas também"
                 f" deixa lições que reforçam sua determinação ({penalidade:+d})."
             )
         if resultado == "mistico":
-            retorno = random.randint(1, 6) + mana
-            personagem.atributos["mana"] = personagem.atributos.get("mana", 0) + 1
+            retorno = rng.randrange(1, 7) + mana
+            personagem.mana += 1
             return (
                 "Seu poder místico pulsa intensamente, revelando segredos antigos."
                 f" Você acumula {retorno} ecos arcanos e aperfeiçoa sua mana."
@@ -157,15 +186,16 @@ class Evento:
 def solicitar_indice(total: int) -> int:
     """Solicita um índice válido ao jogador."""
 
+    validas = {str(indice + 1): indice for indice in range(total)}
     while True:
-        try:
-            escolha = int(input("\nEscolha uma opção: ")) - 1
-        except ValueError:
-            print("Digite o número da opção desejada.")
-            continue
-        if 0 <= escolha < total:
+        entrada = input("\nEscolha uma opção: ").strip()
+        escolha = validas.get(entrada)
+        if escolha is not None:
             return escolha
-        print("Opção inválida, tente novamente.")
+        if entrada.lstrip("+-").isdigit():
+            print("Opção inválida, tente novamente.")
+        else:
+            print("Digite o número da opção desejada.")
 
 
 def solicitar_nome() -> str:
@@ -177,9 +207,11 @@ def solicitar_nome() -> str:
 
 
 def apresentar_opcoes(titulo: str, opcoes: List[Escolha]) -> Escolha:
-    print(f"\n--- {titulo} ---")
-    for indice, opcao in enumerate(opcoes, start=1):
-        print(f"  {indice}. {opcao.apresentar()}")
+    sys.stdout.write(
+        f"\n--- {titulo} ---\n"
+        + "\n".join(f"  {indice}. {opcao.apresentar}" for indice, opcao in enumerate(opcoes, start=1))
+        + "\n"
+    )
     indice = solicitar_indice(len(opcoes))
     return opcoes[indice]
 
@@ -302,12 +334,17 @@ SAUDACAO_DEUS = wrap(
 
 
 def introducao() -> None:
-    print("=" * 88)
-    print("BEM-VINDO AO SIMULADOR DE ISEKAI DE GEM".center(88))
-    print("=" * 88)
-    print(INTRODUCAO)
-    print()
-    print(SAUDACAO_DEUS)
+    sys.stdout.write(
+        "\n".join((
+            "=" * 88,
+            "BEM-VINDO AO SIMULADOR DE ISEKAI DE GEM".center(88),
+            "=" * 88,
+            INTRODUCAO,
+            "",
+            SAUDACAO_DEUS,
+        ))
+        + "\n"
+    )
 
 
 def preparar_personagem() -> Personagem:
@@ -322,13 +359,13 @@ def preparar_personagem() -> Personagem:
 
 
 def simular_aventura(personagem: Personagem) -> None:
-    random.seed()  # garante resultados variados por execução
-    print("\nGem ergue o cetro prateado e os fios do destino começam a brilhar...")
+    rng = random.Random()  # semente nova garante resultados variados por execução
+    sys.stdout.write("\nGem ergue o cetro prateado e os fios do destino começam a brilhar...\n")
     for evento in EVENTOS:
-        print(evento.apresentar())
-        narrativa = personagem.resolver_evento(evento)
-        print(narrativa)
-    print("\n" + personagem.epilogo())
+        sys.stdout.write(evento.apresentar + "\n")
+        narrativa = personagem.resolver_evento(evento, rng)
+        sys.stdout.write(narrativa + "\n")
+    sys.stdout.write("\n" + personagem.epilogo() + "\n")
 
 
 def jogar() -> None: